@@ -8,17 +8,10 @@ while avoiding collisions with walls and the snake's own body.
 from __future__ import annotations
 
 import random
+import time
 import tkinter as tk
-from enum import Enum
-from typing import List, Optional
-
-
-class Direction(Enum):
-    """Enum representing the four possible movement directions."""
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
+from collections import deque
+from typing import Optional
 
 
 class GameConfig:
@@ -29,10 +22,11 @@ class GameConfig:
     WINDOW_WIDTH: int = COLS * TILE_SIZE
     WINDOW_HEIGHT: int = ROWS * TILE_SIZE
     GAME_SPEED: int = 200  # milliseconds between updates
+    GAME_OVER_SPEED: int = 500  # milliseconds between updates after game over
 
     # Colors
     BACKGROUND_COLOR: str = "black"
-    SNAKE_COLOR: str = "lime green"
+    SNAKE_COLOR: str = "#32cd32"  # lime green
     FOOD_COLOR: str = "red"
     TEXT_COLOR: str = "white"
 
@@ -41,33 +35,54 @@ class GameConfig:
     SCORE_FONT: tuple[str, int] = ("Arial", 14)
 
 
-class Tile:
-    """Represents a single tile in the game grid."""
+# Grid geometry bound once for the per-frame code paths
+TILE = GameConfig.TILE_SIZE
+W = GameConfig.WINDOW_WIDTH
+H = GameConfig.WINDOW_HEIGHT
+COLS = GameConfig.COLS
+ROWS = GameConfig.ROWS
 
-    def __init__(self, x: int, y: int) -> None:
-        """
-        Initialize a tile with given coordinates.
+# Tile colors bound once for the per-frame code paths
+BACKGROUND_COLOR = GameConfig.BACKGROUND_COLOR
+SNAKE_COLOR = GameConfig.SNAKE_COLOR
+FOOD_COLOR = GameConfig.FOOD_COLOR
 
-        Args:
-            x: X coordinate in pixels
-            y: Y coordinate in pixels
-        """
-        self.x = x
-        self.y = y
+# Pixel offset of each grid line, indexed by row or column
+PX = tuple(i * TILE for i in range(max(ROWS, COLS) + 1))
 
-    def __eq__(self, other: object) -> bool:
-        """Check if two tiles have the same position."""
-        if not isinstance(other, Tile):
-            return NotImplemented
-        return self.x == other.x and self.y == other.y
+# Movement deltas in tiles as (dx, dy)
+STOP = (0, 0)
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
 
 
 class SnakeGame:
     """Main Snake game class handling all game logic and rendering."""
 
+    _KEY_TO_DELTA: dict[str, tuple[int, int]] = {
+        "Up": UP,
+        "Down": DOWN,
+        "Left": LEFT,
+        "Right": RIGHT,
+        "w": UP,
+        "s": DOWN,
+        "a": LEFT,
+        "d": RIGHT,
+    }
+
+    _OPPOSITE: dict[tuple[int, int], tuple[int, int]] = {
+        UP: DOWN,
+        DOWN: UP,
+        LEFT: RIGHT,
+        RIGHT: LEFT,
+    }
+
     def __init__(self) -> None:
         """Initialize the Snake game."""
         self.config = GameConfig()
+        self._all_cells = frozenset(range(ROWS * COLS))
         self._setup_window()
         self._reset_game()
 
@@ -86,6 +101,36 @@ class SnakeGame:
             highlightthickness=0
         )
         self.canvas.pack()
+
+        # Render all tiles into a single image backing one canvas item
+        self.frame_img = tk.PhotoImage(
+            width=self.config.WINDOW_WIDTH,
+            height=self.config.WINDOW_HEIGHT
+        )
+        self.canvas.create_image(0, 0, anchor="nw", image=self.frame_img)
+        # Pending Tcl fill commands, sent to Tk in one batch per frame
+        self._paint_ops: list[str] = []
+
+        # Persistent UI text items, updated in place
+        self._last_score: Optional[int] = None  # score shown by score_text
+        self._game_over_shown = False  # whether the overlay is visible
+        self.score_text = self.canvas.create_text(
+            10,
+            10,
+            text="",
+            fill=self.config.TEXT_COLOR,
+            font=self.config.SCORE_FONT,
+            anchor="nw"
+        )
+        self.game_over_text = self.canvas.create_text(
+            self.config.WINDOW_WIDTH // 2,
+            self.config.WINDOW_HEIGHT // 2,
+            text="",
+            fill=self.config.TEXT_COLOR,
+            font=self.config.GAME_OVER_FONT,
+            justify=tk.CENTER,
+            state=tk.HIDDEN
+        )
         self.window.update()
 
         # Center the window on the screen
@@ -109,185 +154,207 @@ class SnakeGame:
 
     def _reset_game(self) -> None:
         """Reset the game to initial state."""
-        self.snake_head = Tile(5 * self.config.TILE_SIZE,
-                               5 * self.config.TILE_SIZE)
-        self.snake_body: List[Tile] = []
-        self.food = self._generate_food()
-        self.direction: Optional[Direction] = None
+        row = col = 5
+        # Snake segments from head to tail, plus the cell keys
+        # (row * COLS + col) of the tiles they cover
+        self.body: deque[tuple[int, int]] = deque([(PX[col], PX[row])])
+        self.occupied: set[int] = {row * COLS + col}
+        self.pending_growth = 0
+        food = self._generate_food()
+        assert food is not None  # a one-tile snake always leaves tiles free
+        self.food: tuple[int, int] = food
+        self._delta = STOP  # current (dx, dy), STOP until the first move
         self.game_over = False
         self.score = 0
+        self._dirty = True  # whether the frame needs to be redrawn
+        self._full_redraw = True  # repaint every tile instead of the changes
+        # Tiles changed since the last draw, as (x, y, color)
+        self._tile_updates: list[tuple[int, int, str]] = []
 
-    def _generate_food(self) -> Tile:
-        """Generate food at a random position that doesn't overlap with the snake."""
-        while True:
-            food_x = random.randint(
-                0, self.config.COLS - 1) * self.config.TILE_SIZE
-            food_y = random.randint(
-                0, self.config.ROWS - 1) * self.config.TILE_SIZE
-            food = Tile(food_x, food_y)
+    def _generate_food(self) -> Optional[tuple[int, int]]:
+        """
+        Generate food at a random position that doesn't overlap with the snake.
 
-            # Ensure food doesn't spawn on snake
-            if food != self.snake_head and food not in self.snake_body:
-                return food
+        Returns None when the snake covers every tile of the board.
+        """
+        # Sample once from the free cells so food never spawns on the snake
+        free = tuple(self._all_cells - self.occupied)
+        if not free:
+            return None
+        row, col = divmod(random.choice(free), COLS)
+        return PX[col], PX[row]
 
     def _handle_keypress(self, event: tk.Event) -> None:
         """Handle keyboard input for changing snake direction."""
         if self.game_over:
             if event.keysym == "space":
                 self._reset_game()
+                self._render()
             return
 
-        key_to_direction = {
-            "Up": Direction.UP,
-            "Down": Direction.DOWN,
-            "Left": Direction.LEFT,
-            "Right": Direction.RIGHT,
-            "w": Direction.UP,
-            "s": Direction.DOWN,
-            "a": Direction.LEFT,
-            "d": Direction.RIGHT,
-        }
-
-        new_direction = key_to_direction.get(event.keysym)
-        if new_direction and self._is_valid_direction_change(new_direction):
-            self.direction = new_direction
-
-    def _is_valid_direction_change(self, new_direction: Direction) -> bool:
-        """Check if the direction change is valid (not opposite to current direction)."""
-        if self.direction is None:
-            return True
-
-        opposite_directions = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT,
-        }
-
-        return new_direction != opposite_directions[self.direction]
-
-    def _check_wall_collision(self) -> bool:
-        """Check if the snake head collides with the walls."""
-        return (
-            self.snake_head.x < 0 or
-            self.snake_head.x >= self.config.WINDOW_WIDTH or
-            self.snake_head.y < 0 or
-            self.snake_head.y >= self.config.WINDOW_HEIGHT
-        )
-
-    def _check_self_collision(self) -> bool:
-        """Check if the snake head collides with its own body."""
-        return self.snake_head in self.snake_body
+        # Ignore unknown keys and reversing onto the snake's own body
+        delta = self._KEY_TO_DELTA.get(event.keysym)
+        if delta and delta != self._OPPOSITE.get(self._delta):
+            self._delta = delta
+
+    def _step(self) -> None:
+        """Move the snake one tile and resolve all collisions in one pass."""
+        T = TILE
+        body = self.body
+        occupied = self.occupied
+        head_x, head_y = body[0]
+        dx, dy = self._delta
+        new_x = head_x + dx * T
+        new_y = head_y + dy * T
+
+        # Release the tail first so the head may move into the tile it vacates
+        if self.pending_growth:
+            self.pending_growth -= 1
+        else:
+            tail_x, tail_y = body.pop()
+            occupied.discard((tail_y // T) * COLS + tail_x // T)
+            self._tile_updates.append((tail_x, tail_y, BACKGROUND_COLOR))
 
-    def _update_snake_position(self) -> None:
-        """Update the snake's position based on current direction."""
-        if self.direction is None:
+        # Move head
+        new_head = (new_x, new_y)
+        body.appendleft(new_head)
+        self._dirty = True
+
+        # Check wall collision. The head is off the grid iff one of the terms
+        # is negative, which sets the sign of their bitwise OR. Photo put
+        # cannot address tiles outside the frame image, so this move is not
+        # painted at all.
+        if (new_x | (W - T - new_x) | new_y | (H - T - new_y)) < 0:
+            self._tile_updates.clear()
+            self.game_over = True
             return
+        self._tile_updates.append((new_x, new_y, SNAKE_COLOR))
 
-        # Move body segments
-        for i in range(len(self.snake_body) - 1, -1, -1):
-            if i == 0:
-                self.snake_body[i].x = self.snake_head.x
-                self.snake_body[i].y = self.snake_head.y
-            else:
-                prev_segment = self.snake_body[i - 1]
-                self.snake_body[i].x = prev_segment.x
-                self.snake_body[i].y = prev_segment.y
-
-        # Move head
-        dx, dy = self.direction.value
-        self.snake_head.x += dx * self.config.TILE_SIZE
-        self.snake_head.y += dy * self.config.TILE_SIZE
+        # Check self collision; the new head is not yet part of the occupied set
+        key = (new_y // T) * COLS + new_x // T
+        if key in occupied:
+            self.game_over = True
+            return
+        occupied.add(key)
 
-    def _check_food_collision(self) -> bool:
-        """Check if the snake head collides with food."""
-        return self.snake_head == self.food
+        # Check food consumption
+        if new_head == self.food:
+            self._handle_food_consumption()
 
     def _handle_food_consumption(self) -> None:
         """Handle what happens when snake eats food."""
-        # Add new body segment at food position
-        self.snake_body.append(Tile(self.food.x, self.food.y))
+        # Generate new food; with no free tile left the board is full and
+        # the game ends before the snake could grow any further
+        food = self._generate_food()
+        if food is None:
+            self.game_over = True
+            return
+        self.food = food
+        self._tile_updates.append((*food, FOOD_COLOR))
 
-        # Generate new food
-        self.food = self._generate_food()
+        # Keep the tail in place on the next move to grow by one segment
+        self.pending_growth += 1
 
         # Increase score
         self.score += 1
 
     def _update_game_state(self) -> None:
         """Update the game state for one frame."""
-        if self.game_over:
+        if self.game_over or self._delta == STOP:
             return
 
-        # Update snake position
-        self._update_snake_position()
+        self._step()
 
-        # Check collisions
-        if self._check_wall_collision() or self._check_self_collision():
-            self.game_over = True
-            return
+    def _fill_rect(self, x1: int, y1: int, x2: int, y2: int,
+                   color: str) -> None:
+        """Queue a solid color fill of a frame image region."""
+        # Photo data is a list of rows of colors; brace the color as a single
+        # row of one pixel so names with spaces stay one color in the script
+        self._paint_ops.append("%s put {{{%s}}} -to %d %d %d %d" % (
+            self.frame_img, color, x1, y1, x2, y2))
 
-        # Check food consumption
-        if self._check_food_collision():
-            self._handle_food_consumption()
+    def _fill_tile(self, x: int, y: int, color: str) -> None:
+        """Queue a solid color fill of a single tile."""
+        T = TILE
+        self._fill_rect(x, y, x + T, y + T, color)
 
-    def _draw_tile(self, tile: Tile, color: str) -> None:
-        """Draw a single tile on the canvas."""
-        self.canvas.create_rectangle(
-            tile.x,
-            tile.y,
-            tile.x + self.config.TILE_SIZE,
-            tile.y + self.config.TILE_SIZE,
-            fill=color
-        )
+    def _flush_paint(self) -> None:
+        """Run all queued fills as a single Tcl script."""
+        if self._paint_ops:
+            self.canvas.tk.eval("\n".join(self._paint_ops))
+            self._paint_ops.clear()
 
     def _draw_game_elements(self) -> None:
-        """Draw all game elements on the canvas."""
-        # Clear canvas
-        self.canvas.delete("all")
+        """Draw all game elements into the frame image."""
+        if not self._full_redraw:
+            # Only repaint the tiles that changed since the last draw
+            fill_tile = self._fill_tile
+            for x, y, color in self._tile_updates:
+                fill_tile(x, y, color)
+            self._tile_updates.clear()
+            self._flush_paint()
+            return
+
+        # Clear frame image
+        self._fill_rect(0, 0, W, H, BACKGROUND_COLOR)
 
         # Draw food
-        self._draw_tile(self.food, self.config.FOOD_COLOR)
+        self._fill_tile(*self.food, FOOD_COLOR)
 
-        # Draw snake head
-        self._draw_tile(self.snake_head, self.config.SNAKE_COLOR)
+        # Draw snake, which is a single tile right after a reset
+        self._fill_tile(*self.body[0], SNAKE_COLOR)
 
-        # Draw snake body
-        for segment in self.snake_body:
-            self._draw_tile(segment, self.config.SNAKE_COLOR)
+        self._tile_updates.clear()
+        self._full_redraw = False
+        self._flush_paint()
 
     def _draw_ui(self) -> None:
-        """Draw the user interface elements."""
-        if self.game_over:
-            self.canvas.create_text(
-                self.config.WINDOW_WIDTH // 2,
-                self.config.WINDOW_HEIGHT // 2,
-                text=f"Game Over!\nScore: {self.score}\n\nPress SPACE to restart.",
-                fill=self.config.TEXT_COLOR,
-                font=self.config.GAME_OVER_FONT,
-                justify=tk.CENTER
-            )
-        else:
-            self.canvas.create_text(
-                10,
-                10,
-                text=f"Score: {self.score}",
-                fill=self.config.TEXT_COLOR,
-                font=self.config.SCORE_FONT,
-                anchor="nw"
-            )
+        """Update the user interface elements."""
+        # Toggle the overlay only when entering or leaving game over
+        if self.game_over != self._game_over_shown:
+            if self.game_over:
+                self.canvas.itemconfigure(
+                    self.game_over_text,
+                    text=f"Game Over!\nScore: {self.score}\n\nPress SPACE to restart.",
+                    state=tk.NORMAL
+                )
+                self.canvas.itemconfigure(self.score_text, state=tk.HIDDEN)
+            else:
+                self.canvas.itemconfigure(self.game_over_text, state=tk.HIDDEN)
+                self.canvas.itemconfigure(self.score_text, state=tk.NORMAL)
+            self._game_over_shown = self.game_over
+
+        # Only re-layout the score text when the score changes
+        if not self.game_over and self.score != self._last_score:
+            self.canvas.itemconfigure(
+                self.score_text, text=f"Score: {self.score}")
+            self._last_score = self.score
+
+    def _render(self) -> None:
+        """Redraw the frame if the game state changed since the last draw."""
+        if self._dirty:
+            self._draw_game_elements()
+            self._draw_ui()
+            self._dirty = False
 
     def _game_loop(self) -> None:
         """Main game loop that updates and renders the game."""
         self._update_game_state()
-        self._draw_game_elements()
-        self._draw_ui()
-
-        # Schedule next frame
-        self.window.after(self.config.GAME_SPEED, self._game_loop)
+        self._render()
+
+        # Schedule next frame against the clock so callback time doesn't drift
+        interval = (self.config.GAME_OVER_SPEED if self.game_over
+                    else self.config.GAME_SPEED)
+        self._next_tick += interval * 1_000_000
+        now = time.monotonic_ns()
+        if self._next_tick < now:
+            # Fell behind schedule; drop missed ticks instead of bursting
+            self._next_tick = now
+        self.window.after((self._next_tick - now) // 1_000_000, self._game_loop)
 
     def run(self) -> None:
         """Start the game."""
+        self._next_tick = time.monotonic_ns()
         self._game_loop()
         self.window.mainloop()
 